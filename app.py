@@ -2,15 +2,26 @@ import streamlit as st
 import time
 from utils.sentiment_analyzer import SentimentAnalyzer
 from utils.text_processor import TextProcessor
+from utils.model_warmup import ModelWarmupManager
 from components.ui_components import UIComponents
 from config import Config
 
+@st.cache_resource
+def get_analyzer() -> SentimentAnalyzer:
+    """Share one analyzer across reruns so latency stats persist."""
+    return SentimentAnalyzer()
+
+@st.cache_resource
+def get_warmup_manager() -> ModelWarmupManager:
+    """Share one warm-up manager across reruns and sessions."""
+    return ModelWarmupManager(get_analyzer())
+
 def main():
     """Main application function."""
     
     # Initialize components
     ui = UIComponents()
-    analyzer = SentimentAnalyzer()
+    analyzer = get_analyzer()
     processor = TextProcessor()
     config = Config()
     
@@ -20,6 +31,12 @@ def main():
     # Render sidebar and get settings
     settings = ui.render_sidebar()
     
+    # Pre-load configured models and the selected one (runs again on model switch)
+    if config.WARMUP_ENABLED:
+        warmup = get_warmup_manager()
+        warmup.warm_up(config.WARMUP_MODELS + [settings['selected_model']])
+        ui.render_warmup_status(warmup.get_status())
+    
     # Main content area
     tab1, tab2, tab3 = st.tabs(["Single Text Analysis", "Batch Analysis", "File Upload"])
     
@@ -173,6 +190,9 @@ def main():
             except Exception as e:
                 st.error(f"Error processing file: {str(e)}")
     
+    # Drawn last so the sidebar includes this rerun's requests
+    ui.render_latency_stats(analyzer.get_latency_tracker(settings['selected_model']).summary())
+    
     # Footer
     st.markdown("---")
     st.markdown("""
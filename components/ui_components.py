@@ -85,6 +85,9 @@ class UIComponents:
                 </div>
                 """, unsafe_allow_html=True)
             
+            if result.get('served_by'):
+                st.info(f"⚡ The selected model was slow, so this answer came from a hedge request to {result['served_by']}")
+            
             # Confidence meter
             if show_confidence:
                 st.subheader("📊 Confidence Score")
@@ -203,4 +206,48 @@ class UIComponents:
             st.metric("Sentences", stats['sentence_count'])
         
         with col4:
-            st.metric("Avg Word Length", f"{stats['avg_word_length']:.1f}")
\ No newline at end of file
+            st.metric("Avg Word Length", f"{stats['avg_word_length']:.1f}")
+    
+    @staticmethod
+    def render_warmup_status(status: Dict):
+        """Render model warm-up status in the sidebar."""
+        if not status:
+            return
+        
+        icons = {'warming': '⏳', 'ready': '✅', 'failed': '⚠️'}
+        
+        with st.sidebar.expander("Model Warm-up"):
+            for model_name, state in status.items():
+                st.markdown(f"{icons.get(state, '❔')} {model_name}: {state}")
+    
+    @staticmethod
+    def render_latency_stats(summary: Dict):
+        """Render request latency percentiles in the sidebar."""
+        if not summary.get('count'):
+            return
+        
+        with st.sidebar.expander("Latency"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.metric(
+                    "p50",
+                    f"{summary['p50']:.2f}s",
+                    delta=f"{summary['p50'] - summary['primary_p50']:.2f}s",
+                    delta_color="inverse"
+                )
+            
+            with col2:
+                st.metric(
+                    "p99",
+                    f"{summary['p99']:.2f}s",
+                    delta=f"{summary['p99'] - summary['primary_p99']:.2f}s",
+                    delta_color="inverse"
+                )
+            
+            st.caption(
+                f"{summary['count']} requests, {summary['hedged_count']} hedged, "
+                f"{summary['hedge_wins']} won by hedge ({summary['rerouted']} by another model, "
+                f"excluded from p50/p99), {summary['failed']} failed. "
+                f"Deltas compare against the primary request alone."
+            )
\ No newline at end of file
@@ -11,6 +11,7 @@ class Config:
     HUGGINGFACE_API_TOKEN = os.getenv('HUGGINGFACE_API_TOKEN')
     API_URL = os.getenv('API_URL', 'https://api-inference.huggingface.co/models/cardiffnlp/twitter-roberta-base-sentiment-latest')
     BACKUP_API_URL = os.getenv('BACKUP_API_URL', 'https://api-inference.huggingface.co/models/nlptown/bert-base-multilingual-uncased-sentiment')
+    API_BASE_URL = os.getenv('API_BASE_URL', 'https://api-inference.huggingface.co/models')
     
     # App Configuration
     APP_TITLE = "Sentiment Analysis Dashboard"
@@ -26,4 +27,18 @@ class Config:
     
     # UI Configuration
     MAX_TEXT_LENGTH = 5000
-    BATCH_SIZE = 10
\ No newline at end of file
+    BATCH_SIZE = 10
+    
+    # Latency Configuration
+    WARMUP_ENABLED = os.getenv('WARMUP_ENABLED', 'true').lower() == 'true'
+    WARMUP_MODELS = [m.strip() for m in os.getenv('WARMUP_MODELS', '').split(',') if m.strip()]
+    WARMUP_TIMEOUT = 60  # seconds
+    WARMUP_RETRY_DELAY = 300  # seconds before retrying a model that failed to warm up
+    WARMUP_TTL = 300  # seconds before a warm model is warmed again, the API unloads idle models
+    REQUEST_TIMEOUT = float(os.getenv('REQUEST_TIMEOUT', '30'))  # seconds, per HTTP request and per hedged call
+    HEDGING_ENABLED = os.getenv('HEDGING_ENABLED', 'false').lower() == 'true'
+    HEDGE_API_BASE_URL = os.getenv('HEDGE_API_BASE_URL')  # Replica serving the same MODELS, defaults to API_BASE_URL
+    HEDGE_PERCENTILE = 95
+    HEDGE_MIN_SAMPLES = 20
+    HEDGE_DEFAULT_DEADLINE = 2.0  # seconds, used until enough samples are collected
+    LATENCY_WINDOW = 200
\ No newline at end of file
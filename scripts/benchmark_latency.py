@@ -0,0 +1,83 @@
+"""Measure p50/p99 latency with and without hedging against a local mock server.
+
+Usage:
+    python scripts/benchmark_latency.py --requests 300 --slow-rate 0.02 --slow-delay 1.0
+
+Keep --slow-rate below 5%, or the p95 hedging deadline lands on the slow responses.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sentiment_analyzer import SentimentAnalyzer
+
+class MockInferenceHandler(BaseHTTPRequestHandler):
+    """Answers like the inference API, with an occasional slow response."""
+
+    fast_delay = 0.02
+    slow_delay = 1.0
+    slow_rate = 0.02
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        slow = random.random() < self.slow_rate
+        time.sleep(self.slow_delay if slow else self.fast_delay)
+
+        body = json.dumps([[{"label": "positive", "score": 0.9}, {"label": "negative", "score": 0.1}]]).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def run(base_url: str, requests_count: int, hedging: bool) -> dict:
+    """Send requests through SentimentAnalyzer and return its latency summary."""
+    analyzer = SentimentAnalyzer()
+    analyzer.config.HUGGINGFACE_API_TOKEN = "mock-token"
+    analyzer.config.API_BASE_URL = base_url
+    analyzer.config.HEDGING_ENABLED = hedging
+
+    for _ in range(requests_count):
+        analyzer.query_api("I love this product!", "Twitter RoBERTa")
+
+    time.sleep(MockInferenceHandler.slow_delay)  # Let censored primaries report their real latency
+    return analyzer.get_latency_tracker("Twitter RoBERTa").summary()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--slow-rate', type=float, default=0.02)
+    parser.add_argument('--slow-delay', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    MockInferenceHandler.slow_rate = args.slow_rate
+    MockInferenceHandler.slow_delay = args.slow_delay
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockInferenceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/models"
+
+    print(f"{'mode':<10}{'p50':>10}{'p99':>10}{'hedged':>10}{'wins':>8}")
+    for hedging in (False, True):
+        summary = run(base_url, args.requests, hedging)
+        print(f"{'hedged' if hedging else 'baseline':<10}"
+              f"{summary['p50'] * 1000:>8.1f}ms{summary['p99'] * 1000:>8.1f}ms"
+              f"{summary['hedged_count']:>10}{summary['hedge_wins']:>8}")
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
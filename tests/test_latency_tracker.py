@@ -0,0 +1,71 @@
+from utils.latency_tracker import LatencyTracker
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert LatencyTracker.percentile(samples, 50) == 50
+    assert LatencyTracker.percentile(samples, 99) == 99
+    assert LatencyTracker.percentile([3.0], 95) == 3.0
+    assert LatencyTracker.percentile([], 50) == 0.0
+
+
+def test_deadline_falls_back_below_min_samples():
+    tracker = LatencyTracker()
+    for _ in range(5):
+        tracker.record(1.0, 1.0)
+
+    assert tracker.deadline(95, min_samples=10, default=2.0) == 2.0
+
+
+def test_deadline_uses_primary_percentile():
+    tracker = LatencyTracker()
+    for i in range(1, 21):
+        tracker.record(0.1, float(i))
+
+    assert tracker.deadline(95, min_samples=10, default=2.0) == 19.0
+
+
+def test_update_primary_replaces_censored_sample():
+    tracker = LatencyTracker()
+    sample = tracker.record(0.1, 0.1, hedged=True, hedge_won=True)
+    tracker.update_primary(sample, 3.0)
+
+    summary = tracker.summary()
+    assert summary["p99"] == 0.1
+    assert summary["primary_p99"] == 3.0
+
+
+def test_summary_counts_share_the_window():
+    tracker = LatencyTracker(window=10)
+    for _ in range(25):
+        tracker.record(0.1, 0.5, hedged=True, hedge_won=True)
+
+    summary = tracker.summary()
+    assert summary["count"] == 10
+    assert summary["hedged_count"] == 10
+    assert summary["hedge_wins"] == 10
+
+
+def test_summary_excludes_rerouted_answers():
+    tracker = LatencyTracker()
+    tracker.record(0.2, 0.2)
+    tracker.record(None, 0.1, hedged=True, hedge_won=True)
+
+    summary = tracker.summary()
+    assert summary["count"] == 2
+    assert summary["rerouted"] == 1
+    assert summary["p99"] == 0.2
+
+
+def test_failures_are_counted_but_not_in_percentiles():
+    tracker = LatencyTracker()
+    for _ in range(10):
+        tracker.record(1.0, 1.0)
+    for _ in range(10):
+        tracker.record_failure()
+
+    summary = tracker.summary()
+    assert summary["count"] == 20
+    assert summary["failed"] == 10
+    assert summary["p50"] == 1.0
+    assert tracker.deadline(95, min_samples=20, default=2.0) == 2.0
\ No newline at end of file
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from utils.sentiment_analyzer import SentimentAnalyzer
+
+PRIMARY_RESULT = ([[{"label": "positive", "score": 0.9}]], 200)
+HEDGE_RESULT = ([[{"label": "negative", "score": 0.8}]], 200)
+
+
+class StubAPI:
+    """Stands in for _post. Each endpoint answers only once the test releases it."""
+
+    def __init__(self, analyzer, primary, hedge):
+        self.urls = []
+        self.responses = {"primary": primary, "hedge": hedge}
+        self.released = {"primary": threading.Event(), "hedge": threading.Event()}
+        analyzer._post = self.post
+
+    def release(self, *kinds):
+        for kind in kinds:
+            self.released[kind].set()
+
+    def post(self, api_url, payload):
+        self.urls.append(api_url)
+        kind = "primary" if api_url.startswith("http://primary") else "hedge"
+        if not self.released[kind].wait(timeout=30):
+            return None, None
+        return self.responses[kind]
+
+
+def wait_until(condition, timeout=5):
+    """Poll for a background callback to land."""
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = SentimentAnalyzer()
+    analyzer.config.HUGGINGFACE_API_TOKEN = "test-token"
+    analyzer.config.HEDGING_ENABLED = True
+    analyzer.config.API_URL = "http://primary/default"
+    analyzer.config.API_BASE_URL = "http://primary"
+    analyzer.config.HEDGE_API_BASE_URL = "http://replica"
+    analyzer.config.BACKUP_API_URL = "http://backup"
+    analyzer.config.HEDGE_DEFAULT_DEADLINE = 5.0
+    analyzer.config.REQUEST_TIMEOUT = 5.0
+    return analyzer
+
+
+@pytest.fixture
+def stub(analyzer):
+    stub = StubAPI(analyzer, PRIMARY_RESULT, HEDGE_RESULT)
+    yield stub
+    stub.release("primary", "hedge")  # Let background threads finish
+
+
+def test_fast_primary_is_not_hedged(analyzer, stub):
+    stub.release("primary")
+
+    assert analyzer.query_api("great", "DistilBERT") == PRIMARY_RESULT[0]
+    assert len(stub.urls) == 1
+    assert analyzer.get_latency_tracker("DistilBERT").summary()["hedged_count"] == 0
+
+
+def test_hedge_wins_when_primary_is_slow(analyzer, stub):
+    analyzer.config.HEDGE_DEFAULT_DEADLINE = 0.0
+    stub.release("hedge")
+
+    assert analyzer.query_api("great", "DistilBERT") == HEDGE_RESULT[0]
+
+    tracker = analyzer.get_latency_tracker("DistilBERT")
+    summary = tracker.summary()
+    assert summary["hedge_wins"] == 1
+
+    # The censored primary is replaced by its real latency once it answers
+    stub.release("primary")
+    wait_until(lambda: tracker.summary()["primary_p99"] > summary["p99"])
+
+
+def test_both_requests_fail_returns_none(analyzer, stub):
+    stub.responses = {"primary": (None, 503), "hedge": (None, None)}
+    stub.release("primary", "hedge")
+
+    assert analyzer.query_api("great", "DistilBERT") is None
+    summary = analyzer.get_latency_tracker("DistilBERT").summary()
+    assert summary["hedged_count"] == 1
+    assert summary["hedge_wins"] == 0
+    assert summary["failed"] == 1
+    assert summary["p99"] == 0.0
+
+
+def test_rate_limited_primary_is_not_hedged(analyzer, stub):
+    stub.responses["primary"] = (None, 429)
+    stub.release("primary", "hedge")
+
+    assert analyzer.query_api("great", "DistilBERT") is None
+    assert len(stub.urls) == 1
+
+
+def test_stuck_requests_time_out(analyzer, stub):
+    analyzer.config.HEDGE_DEFAULT_DEADLINE = 0.0
+    analyzer.config.REQUEST_TIMEOUT = 0.1
+
+    start = time.monotonic()
+    assert analyzer.query_api("great", "DistilBERT") is None
+    assert time.monotonic() - start < 5  # Far below the stub's 30 s hang
+    assert len(stub.urls) == 2
+
+
+def test_backup_model_answer_is_flagged(analyzer, stub):
+    analyzer.config.HEDGE_DEFAULT_DEADLINE = 0.0
+    stub.release("hedge")
+
+    result = analyzer.analyze_sentiment("great")
+    assert result["sentiment"] == "Negative"
+    assert result["served_by"] == "http://backup"
+    assert analyzer.get_latency_tracker().summary()["rerouted"] == 1
+
+
+def test_replica_serves_the_selected_model(analyzer, stub):
+    analyzer.config.HEDGE_DEFAULT_DEADLINE = 0.0
+    stub.release("hedge")
+
+    result = analyzer.analyze_sentiment("great", "DistilBERT")
+    assert stub.urls[1] == f"http://replica/{analyzer.config.MODELS['DistilBERT']}"
+    assert result["served_by"] is None
+    assert analyzer.get_latency_tracker("DistilBERT").summary()["rerouted"] == 0
\ No newline at end of file
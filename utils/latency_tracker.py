@@ -0,0 +1,77 @@
+import math
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+class LatencyTracker:
+    """Rolling latency statistics for API requests."""
+
+    def __init__(self, window: int = 200):
+        self._lock = threading.Lock()
+        # Each sample is [effective, primary, hedged, hedge_won]; failures have no latencies
+        self._samples = deque(maxlen=window)
+
+    def record(self, effective: Optional[float], primary: float, hedged: bool = False, hedge_won: bool = False) -> List:
+        """Record one request.
+
+        effective is how long the caller waited for an answer, or None when the
+        answer came from another model. primary is how long the original request
+        took. When a hedge answered first, pass the time elapsed so far as
+        primary and call update_primary once it finishes.
+        """
+        sample = [effective, primary, hedged, hedge_won]
+        with self._lock:
+            self._samples.append(sample)
+        return sample
+
+    def record_failure(self, hedged: bool = False):
+        """Count a request that got no answer, without skewing the percentiles."""
+        with self._lock:
+            self._samples.append([None, None, hedged, False])
+
+    def update_primary(self, sample: List, seconds: float):
+        """Replace a censored primary latency with its real duration."""
+        with self._lock:
+            sample[1] = max(sample[1], seconds)
+
+    def deadline(self, percentile: float, min_samples: int, default: float) -> float:
+        """Get the hedging deadline from the primary latency distribution."""
+        with self._lock:
+            primary = [s[1] for s in self._samples if s[1] is not None]
+
+        if len(primary) < min_samples:
+            return default
+
+        return self.percentile(primary, percentile)
+
+    def summary(self) -> Dict:
+        """Summarize p50/p95/p99 latency with and without hedging."""
+        with self._lock:
+            samples = [list(s) for s in self._samples]
+
+        effective = [s[0] for s in samples if s[0] is not None]
+        primary = [s[1] for s in samples if s[1] is not None]
+
+        summary = {
+            "count": len(samples),
+            "hedged_count": sum(1 for s in samples if s[2]),
+            "hedge_wins": sum(1 for s in samples if s[3]),
+            "rerouted": len(primary) - len(effective),
+            "failed": len(samples) - len(primary)
+        }
+
+        for pct in (50, 95, 99):
+            summary[f"p{pct}"] = self.percentile(effective, pct)
+            summary[f"primary_p{pct}"] = self.percentile(primary, pct)
+
+        return summary
+
+    @staticmethod
+    def percentile(samples: List[float], pct: float) -> float:
+        """Nearest-rank percentile of a list of samples."""
+        if not samples:
+            return 0.0
+
+        ordered = sorted(samples)
+        rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
\ No newline at end of file
@@ -0,0 +1,46 @@
+import threading
+import time
+from typing import Dict, List
+from utils.sentiment_analyzer import SentimentAnalyzer
+
+class ModelWarmupManager:
+    """Pre-load models in the background so the first request is not a cold start."""
+
+    def __init__(self, analyzer: SentimentAnalyzer):
+        self.analyzer = analyzer
+        self.status = {}  # Model name -> 'warming' | 'ready' | 'failed'
+        self._expires_at = {}  # Model name -> time a ready or failed model is warmed again
+        self._lock = threading.Lock()
+
+    def warm_up(self, model_names: List[str]):
+        """Start warming any models that are not loading or recently warmed."""
+        for model_name in model_names:
+            if model_name not in self.analyzer.config.MODELS:
+                continue
+
+            with self._lock:
+                state = self.status.get(model_name)
+                if state == 'warming':
+                    continue
+                if state in ('ready', 'failed') and time.monotonic() < self._expires_at[model_name]:
+                    continue
+                self.status[model_name] = 'warming'
+
+            thread = threading.Thread(target=self._warm_model, args=(model_name,), daemon=True)
+            thread.start()
+
+    def get_status(self) -> Dict[str, str]:
+        """Get a snapshot of warm-up status for all models."""
+        with self._lock:
+            return dict(self.status)
+
+    def _warm_model(self, model_name: str):
+        """Warm a single model and record the outcome."""
+        ready = self.analyzer.warm_model(model_name)
+
+        config = self.analyzer.config
+        delay = config.WARMUP_TTL if ready else config.WARMUP_RETRY_DELAY
+
+        with self._lock:
+            self.status[model_name] = 'ready' if ready else 'failed'
+            self._expires_at[model_name] = time.monotonic() + delay
\ No newline at end of file
@@ -1,8 +1,11 @@
 import requests
 import json
 import time
+import threading
+from concurrent.futures import Future, wait, FIRST_COMPLETED
 from typing import Dict, List, Optional, Tuple
 from config import Config
+from utils.latency_tracker import LatencyTracker
 
 class SentimentAnalyzer:
     """Sentiment analysis using Hugging Face API."""
@@ -13,37 +16,204 @@ class SentimentAnalyzer:
             "Authorization": f"Bearer {self.config.HUGGINGFACE_API_TOKEN}",
             "Content-Type": "application/json"
         }
+        self.latency = {}  # API URL -> LatencyTracker
+        self._latency_lock = threading.Lock()
+    
+    def get_api_url(self, model_name: str = None) -> str:
+        """Resolve the inference API URL for a model."""
+        if model_name and model_name in self.config.MODELS:
+            return f"{self.config.API_BASE_URL}/{self.config.MODELS[model_name]}"
+        return self.config.API_URL
+    
+    def get_latency_tracker(self, model_name: str = None) -> LatencyTracker:
+        """Get the latency tracker for a model."""
+        api_url = self.get_api_url(model_name)
+        
+        with self._latency_lock:
+            if api_url not in self.latency:
+                self.latency[api_url] = LatencyTracker(self.config.LATENCY_WINDOW)
+            return self.latency[api_url]
+    
+    def warm_model(self, model_name: str = None) -> bool:
+        """Load a model on the inference API before the first real request."""
+        
+        if not self.config.HUGGINGFACE_API_TOKEN:
+            return False
+        
+        api_url = self.get_api_url(model_name)
+        urls = [api_url]
+        
+        if self.config.HEDGING_ENABLED:
+            hedge_url, _ = self._get_hedge_target(model_name)
+            if hedge_url != api_url:
+                urls.append(hedge_url)
+        
+        payload = {"inputs": "warm up", "options": {"wait_for_model": True}}
+        
+        try:
+            for url in urls:
+                response = requests.post(url, headers=self.headers, json=payload,
+                                         timeout=self.config.WARMUP_TIMEOUT)
+                if response.status_code != 200:
+                    print(f"Warm-up Error: {response.status_code} - {response.text}")
+                    return False
+            return True
+            
+        except requests.exceptions.RequestException as e:
+            print(f"Warm-up failed: {e}")
+            return False
     
     def query_api(self, text: str, model_name: str = None) -> Optional[Dict]:
         """Query Hugging Face API for sentiment analysis."""
+        return self._query(text, model_name)[0]
+    
+    def _query(self, text: str, model_name: str = None) -> Tuple[Optional[Dict], Optional[str]]:
+        """Query the API, returning the result and the hedge URL if another model answered."""
         
         if not self.config.HUGGINGFACE_API_TOKEN:
             raise ValueError("Hugging Face API token not found. Please set HUGGINGFACE_API_TOKEN in .env file")
         
         # Select model URL
-        if model_name and model_name in self.config.MODELS:
-            api_url = f"https://api-inference.huggingface.co/models/{self.config.MODELS[model_name]}"
-        else:
-            api_url = self.config.API_URL
+        api_url = self.get_api_url(model_name)
+        tracker = self.get_latency_tracker(model_name)
         
         payload = {"inputs": text}
         
+        if self.config.HEDGING_ENABLED:
+            hedge_url, other_model = self._get_hedge_target(model_name)
+            return self._hedged_query(api_url, hedge_url, payload, tracker, other_model)
+        
+        start = time.perf_counter()
+        result, _ = self._post(api_url, payload)
+        elapsed = time.perf_counter() - start
+        
+        if result is None:
+            tracker.record_failure()
+        else:
+            tracker.record(elapsed, elapsed)
+        return result, None
+    
+    def _post(self, api_url: str, payload: Dict) -> Tuple[Optional[Dict], Optional[int]]:
+        """Send a single request to the inference API.
+        
+        Returns the result and the HTTP status code, which is None when
+        no response arrived (timeout or connection error).
+        """
         try:
-            response = requests.post(api_url, headers=self.headers, json=payload)
+            response = requests.post(api_url, headers=self.headers, json=payload,
+                                     timeout=self.config.REQUEST_TIMEOUT)
             
             if response.status_code == 503:  # Model loading
                 time.sleep(10)  # Wait for model to load
-                response = requests.post(api_url, headers=self.headers, json=payload)
+                response = requests.post(api_url, headers=self.headers, json=payload,
+                                         timeout=self.config.REQUEST_TIMEOUT)
             
             if response.status_code == 200:
-                return response.json()
+                return response.json(), response.status_code
             else:
                 print(f"API Error: {response.status_code} - {response.text}")
-                return None
+                return None, response.status_code
                 
         except requests.exceptions.RequestException as e:
             print(f"Request failed: {e}")
-            return None
+            return None, None
+    
+    def _hedged_query(self, api_url: str, hedge_url: str, payload: Dict, tracker: LatencyTracker,
+                      other_model: bool = False) -> Tuple[Optional[Dict], Optional[str]]:
+        """Send a duplicate request when the primary misses the p95 deadline."""
+        primary = self._start_request(api_url, payload)
+        start = time.perf_counter()  # Threads are not queued, so the primary is already running
+        
+        deadline = min(tracker.deadline(
+            self.config.HEDGE_PERCENTILE,
+            self.config.HEDGE_MIN_SAMPLES,
+            self.config.HEDGE_DEFAULT_DEADLINE
+        ), self.config.REQUEST_TIMEOUT)
+        
+        done, _ = wait({primary}, timeout=deadline)
+        if done:
+            result, status = self._outcome(primary)
+            # Don't hedge client errors like 429, a duplicate would only add load
+            if result is not None or not self._is_retryable(status):
+                if result is None:
+                    tracker.record_failure()
+                else:
+                    elapsed = time.perf_counter() - start
+                    tracker.record(elapsed, elapsed)
+                return result, None
+        
+        # Primary is slow or hit a retryable error, race it against a hedge and take the first answer
+        hedge = self._start_request(hedge_url, payload)
+        pending = {primary, hedge}
+        
+        while pending:
+            remaining = deadline + self.config.REQUEST_TIMEOUT - (time.perf_counter() - start)
+            if remaining <= 0:
+                break
+            
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                result, _ = self._outcome(future)
+                if result is not None:
+                    rerouted = future is hedge and other_model
+                    self._record_hedged(tracker, primary, start, hedge_won=future is hedge,
+                                        rerouted=rerouted)
+                    return result, hedge_url if rerouted else None
+        
+        tracker.record_failure(hedged=True)
+        return None, None
+    
+    def _record_hedged(self, tracker: LatencyTracker, primary: Future, start: float,
+                       hedge_won: bool = False, rerouted: bool = False):
+        """Record a hedged call, filling in the primary's real latency once it finishes."""
+        elapsed = time.perf_counter() - start
+        effective = None if rerouted else elapsed  # Keep other models out of this model's stats
+        sample = tracker.record(effective, elapsed, hedged=True, hedge_won=hedge_won)
+        
+        if not primary.done():
+            primary.add_done_callback(
+                lambda _: tracker.update_primary(sample, time.perf_counter() - start)
+            )
+    
+    def _outcome(self, future: Future) -> Tuple[Optional[Dict], Optional[int]]:
+        """Get a finished request's result and status, treating an exception as no response."""
+        if future.exception() is not None:
+            print(f"Request failed: {future.exception()}")
+            return None, None
+        return future.result()
+    
+    @staticmethod
+    def _is_retryable(status: Optional[int]) -> bool:
+        """Whether a failed request is worth hedging: no response or a server error."""
+        return status is None or status >= 500
+    
+    def _start_request(self, api_url: str, payload: Dict) -> Future:
+        """Run _post on its own daemon thread.
+        
+        Requests are not pooled, so a stuck primary can never keep its
+        hedge from starting. _post's timeout bounds each thread's lifetime.
+        """
+        future = Future()
+        
+        def run():
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(self._post(api_url, payload))
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, daemon=True).start()
+        return future
+    
+    def _get_hedge_target(self, model_name: str = None) -> Tuple[str, bool]:
+        """Pick where to send a hedged request and whether it serves a different model."""
+        if model_name and model_name in self.config.MODELS:
+            # Same model on a replica, or a duplicate to the same endpoint
+            base_url = self.config.HEDGE_API_BASE_URL or self.config.API_BASE_URL
+            return f"{base_url}/{self.config.MODELS[model_name]}", False
+        
+        # The default API_URL model falls back to a different model
+        return self.config.BACKUP_API_URL, self.config.BACKUP_API_URL != self.config.API_URL
     
     def analyze_sentiment(self, text: str, model_name: str = None) -> Dict:
         """Analyze sentiment and return formatted results."""
@@ -64,7 +234,7 @@ class SentimentAnalyzer:
                 "all_scores": []
             }
         
-        result = self.query_api(text, model_name)
+        result, served_by = self._query(text, model_name)
         
         if result is None:
             return {
@@ -89,6 +259,7 @@ class SentimentAnalyzer:
                     "sentiment": sentiment,
                     "confidence": confidence,
                     "all_scores": sorted_scores,
+                    "served_by": served_by,
                     "error": None
                 }
             else:
@@ -83,6 +83,10 @@ class TextProcessor:
                 'Error': result.get('error', None)
             }
             
+            # Flag answers served by a hedge to another model
+            if result.get('served_by'):
+                row['Served By'] = result['served_by']
+            
             # Add individual label scores
             if result.get('all_scores'):
                 for score in result['all_scores']: